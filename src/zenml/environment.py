@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Environment implementation."""
 
+import functools
 import os
 import platform
 from importlib.util import find_spec
@@ -247,9 +248,13 @@ class Environment(metaclass=SingletonMetaClass):
             return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def in_notebook() -> bool:
         """If the current Python process is running in a notebook.
 
+        The result is cached as a process does not start or stop running in
+        a notebook while it is alive.
+
         Returns:
             `True` if the current Python process is running in a notebook,
             `False` otherwise.
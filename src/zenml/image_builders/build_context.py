@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Image build context."""
 
+import hashlib
 import os
 from pathlib import Path
 from typing import IO, Dict, List, Optional, Set, Tuple, cast
@@ -114,6 +115,31 @@ class BuildContext:
                 with file_source.open("r") as f:
                     self._extra_files[file_destination.as_posix()] = f.read()
 
+    def compute_checksum(self) -> str:
+        """Computes a checksum of all files in the build context.
+
+        Returns:
+            The checksum.
+        """
+        hash_ = hashlib.md5()
+
+        if self._root:
+            for file in sorted(self._get_files(log=False)):
+                file_path = os.path.join(self._root, file)
+                if not os.path.isfile(file_path):
+                    continue
+
+                hash_.update(file.encode())
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        hash_.update(chunk)
+
+        for destination, content in sorted(self._get_extra_files()):
+            hash_.update(destination.encode())
+            hash_.update(content.encode())
+
+        return hash_.hexdigest()
+
     def write_archive(self, output_file: IO[bytes], gzip: bool = True) -> None:
         """Writes an archive of the build context to the given file.
 
@@ -151,14 +177,17 @@ class BuildContext:
                 os.path.join(self._root, ".dockerignore"),
             )
 
-    def _get_files(self) -> Set[str]:
+    def _get_files(self, log: bool = True) -> Set[str]:
         """Gets all non-ignored files in the build context root directory.
 
+        Args:
+            log: If True, will log if no dockerignore file was found.
+
         Returns:
             All build context files.
         """
         if self._root:
-            exclude_patterns = self._get_exclude_patterns()
+            exclude_patterns = self._get_exclude_patterns(log=log)
             from docker.utils import build as docker_build_utils
 
             return cast(
@@ -179,9 +208,12 @@ class BuildContext:
         """
         return list(self._extra_files.items())
 
-    def _get_exclude_patterns(self) -> List[str]:
+    def _get_exclude_patterns(self, log: bool = True) -> List[str]:
         """Gets all exclude patterns from the dockerignore file.
 
+        Args:
+            log: If True, will log if no dockerignore file was found.
+
         Returns:
             The exclude patterns from the dockerignore file.
         """
@@ -192,10 +224,11 @@ class BuildContext:
             patterns.append(f"!/{REPOSITORY_DIRECTORY_NAME}")
             return patterns
         else:
-            logger.info(
-                "No `.dockerignore` found, including all files inside build "
-                "context.",
-            )
+            if log:
+                logger.info(
+                    "No `.dockerignore` found, including all files inside "
+                    "build context.",
+                )
             return []
 
     @staticmethod
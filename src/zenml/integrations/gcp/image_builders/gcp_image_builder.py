@@ -175,11 +175,25 @@ class GCPImageBuilder(BaseImageBuilder, GoogleCredentialsMixin):
                 ),
             ),
             steps=[
+                {
+                    # Pull the previously pushed image with the same name so
+                    # its layers can be reused as build cache. The image
+                    # doesn't exist yet for the first build, so we ignore
+                    # failures of this step.
+                    "name": cloud_builder_image,
+                    "entrypoint": "bash",
+                    "args": [
+                        "-c",
+                        f"docker pull {image_name} || exit 0",
+                    ],
+                },
                 {
                     "name": cloud_builder_image,
                     "args": [
                         "build",
                         cloud_builder_network_option,
+                        "--cache-from",
+                        image_name,
                         "-t",
                         image_name,
                         ".",
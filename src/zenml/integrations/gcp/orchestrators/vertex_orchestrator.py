@@ -159,14 +159,9 @@ class VertexOrchestrator(ContainerizedOrchestrator, GoogleCredentialsMixin):
                 )
 
             # Validate that the rest of the components are not local.
-            for stack_comp in stack.components.values():
-                # For Forward compatibility a list of components is returned,
-                # but only the first item is relevant for now
-                # TODO: [server] make sure the ComponentModel actually has
-                #  a local_path property or implement similar check
-                local_path = stack_comp.local_path
-                if not local_path:
-                    continue
+            local_components = stack.local_components
+            if local_components:
+                stack_comp, _ = local_components[0]
                 return False, (
                     f"The '{stack_comp.name}' {stack_comp.type.value} is a "
                     f"local stack component. The Vertex AI Pipelines "
@@ -288,10 +288,9 @@ class KubeflowOrchestrator(ContainerizedOrchestrator):
                 # go through all stack components and identify those that
                 # advertise a local path where they persist information that
                 # they need to be available when running pipelines.
-                for stack_comp in stack.components.values():
-                    local_path = stack_comp.local_path
-                    if not local_path:
-                        continue
+                local_components = stack.local_components
+                if local_components:
+                    stack_comp, _ = local_components[0]
                     return False, (
                         f"{msg}the Kubeflow orchestrator is configured to run "
                         f"pipelines in a remote Kubernetes cluster but the "
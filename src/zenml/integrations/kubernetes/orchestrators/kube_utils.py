@@ -31,15 +31,19 @@ Internal interface: no backwards compatibility guarantees.
 Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils.py.
 """
 
-import datetime
 import enum
+import math
 import re
+import threading
 import time
-from typing import Any, Callable, Optional, TypeVar, cast
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client.rest import ApiException
+from urllib3.exceptions import ReadTimeoutError
 
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_cluster_role_binding_manifest_for_service_account,
@@ -50,6 +54,18 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Timestamp Kubernetes prefixes pod log lines with, e.g.
+# `2023-07-21T16:01:02.690661123Z`.
+LOG_TIMESTAMP_REGEX = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})"  # date and time
+    r"(?:\.(\d+))?"  # optional fractional seconds
+    r"(Z|[+-]\d{2}:\d{2})"  # time zone offset
+)
+LOG_RESUME_MARGIN_SECS = 60
+# Maximum duration of a single log stream when waiting for a pod can be
+# stopped, so that a stop request is noticed even while streaming logs.
+STOP_EVENT_LOG_STREAM_SECS = 10
+
 
 class PodPhase(enum.Enum):
     """Phase of the Kubernetes pod.
@@ -168,6 +184,97 @@ def get_pod(
         raise RuntimeError from e
 
 
+def _parse_log_timestamp(timestamp: str) -> Optional[int]:
+    """Parses the timestamp Kubernetes adds to a pod log line.
+
+    Args:
+        timestamp: The RFC3339 timestamp with optional fractional seconds.
+
+    Returns:
+        The timestamp in nanoseconds since the epoch, or `None` if the
+        timestamp could not be parsed.
+    """
+    match = LOG_TIMESTAMP_REGEX.fullmatch(timestamp)
+    if not match:
+        return None
+    date_time, fraction, offset = match.groups()
+    if offset == "Z":
+        offset = "+00:00"
+    seconds = int(datetime.fromisoformat(date_time + offset).timestamp())
+    return seconds * 10**9 + int((fraction or "").ljust(9, "0")[:9])
+
+
+def stream_pod_logs(
+    core_api: k8s_client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    since_timestamp: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> Optional[int]:
+    """Stream the logs of a pod to `zenml.logger.info()`.
+
+    The log stream is kept open by the Kubernetes API server and new lines are
+    pushed as soon as the pod writes them. The stream ends once the container
+    of the pod terminated, the connection was dropped or the deadline passed.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        since_timestamp: Timestamp (in nanoseconds since the epoch) of the
+            last log line that was logged in a previous call. Only lines after
+            it are logged, and only the recent part of the logs is requested
+            from the Kubernetes API.
+        deadline: Optional `time.monotonic()` value after which the stream is
+            closed, even if the pod is still running.
+
+    Returns:
+        The timestamp of the last log line of the pod that was logged so far,
+        to pass to the next call.
+    """
+    kwargs: Dict[str, Any] = {}
+    if since_timestamp is not None:
+        # Request slightly more logs than needed to account for clock
+        # differences between this machine and the Kubernetes node.
+        kwargs["since_seconds"] = (
+            max(math.ceil(time.time() - since_timestamp / 10**9), 0)
+            + LOG_RESUME_MARGIN_SECS
+        )
+    if deadline is not None:
+        remaining_time = deadline - time.monotonic()
+        if remaining_time <= 0:
+            return since_timestamp
+        # Also time out if the pod doesn't write any logs until the deadline.
+        kwargs["_request_timeout"] = remaining_time
+
+    last_timestamp = since_timestamp
+    try:
+        for line in k8s_watch.Watch().stream(
+            core_api.read_namespaced_pod_log,
+            name=pod_name,
+            namespace=namespace,
+            timestamps=True,
+            **kwargs,
+        ):
+            raw_timestamp, _, message = line.partition(" ")
+            timestamp = _parse_log_timestamp(raw_timestamp)
+            if timestamp is None:
+                logger.info(line)
+            elif since_timestamp is None or timestamp > since_timestamp:
+                # Only skip lines of a previous stream, as multiple lines of
+                # this stream can share the same timestamp.
+                logger.info(message)
+                if last_timestamp is None or timestamp > last_timestamp:
+                    last_timestamp = timestamp
+
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+    except ReadTimeoutError:
+        pass
+
+    return last_timestamp
+
+
 def wait_pod(
     core_api: k8s_client.CoreV1Api,
     pod_name: str,
@@ -176,6 +283,7 @@ def wait_pod(
     timeout_sec: int = 0,
     exponential_backoff: bool = False,
     stream_logs: bool = False,
+    stop_event: Optional[threading.Event] = None,
 ) -> k8s_client.V1Pod:
     """Wait for a pod to meet an exit condition.
 
@@ -190,40 +298,56 @@ def wait_pod(
             condition, or 0 to wait for an unlimited duration.
             Defaults to unlimited.
         exponential_backoff: Whether to use exponential back off for polling.
-            Defaults to False.
+            The polling interval is reset whenever the pod phase changes or
+            new logs were streamed. Defaults to False.
         stream_logs: Whether to stream the pod logs to
             `zenml.logger.info()`. Defaults to False.
+        stop_event: Optional event which stops the wait when it is set. Log
+            streams are then restarted every `STOP_EVENT_LOG_STREAM_SECS`
+            seconds so the event is noticed while streaming logs as well.
 
     Raises:
-        RuntimeError: when the function times out.
+        RuntimeError: when the function times out or the wait is cancelled.
 
     Returns:
         The pod object which meets the exit condition.
     """
-    start_time = datetime.datetime.utcnow()
+    start_time = time.monotonic()
+    deadline = start_time + timeout_sec if timeout_sec != 0 else None
 
     # Link to exponential back-off algorithm used here:
     # https://cloud.google.com/storage/docs/exponential-backoff
-    backoff_interval = 1
-    maximum_backoff = 32
+    minimum_backoff = 1.0
+    maximum_backoff = 32.0
+    backoff_factor = 1.5
+    backoff_interval = minimum_backoff
 
-    logged_lines = 0
+    last_log_timestamp: Optional[int] = None
+    phase: Optional[str] = None
 
     while True:
         resp = get_pod(core_api, pod_name, namespace)
+        previous_log_timestamp = last_log_timestamp
 
-        # Stream logs to `zenml.logger.info()`.
-        # TODO: can we do this without parsing all logs every time?
+        # Stream logs to `zenml.logger.info()`. This blocks until the pod
+        # container terminated or the timeout passed, after which we refresh
+        # the pod status to detect completion without waiting for another
+        # polling interval.
         if stream_logs and pod_is_not_pending(resp):
-            response = core_api.read_namespaced_pod_log(
-                name=pod_name,
+            stream_deadline = deadline
+            if stop_event is not None:
+                stream_deadline = min(
+                    deadline or math.inf,
+                    time.monotonic() + STOP_EVENT_LOG_STREAM_SECS,
+                )
+            last_log_timestamp = stream_pod_logs(
+                core_api=core_api,
+                pod_name=pod_name,
                 namespace=namespace,
+                since_timestamp=last_log_timestamp,
+                deadline=stream_deadline,
             )
-            logs = response.splitlines()
-            if len(logs) > logged_lines:
-                for line in logs[logged_lines:]:
-                    logger.info(line)
-                logged_lines = len(logs)
+            resp = get_pod(core_api, pod_name, namespace)
 
         # Raise an error if the pod failed.
         if pod_failed(resp):
@@ -234,17 +358,33 @@ def wait_pod(
             return resp
 
         # Check if wait timed out.
-        elapse_time = datetime.datetime.utcnow() - start_time
-        if elapse_time.seconds >= timeout_sec and timeout_sec != 0:
+        elapsed_time = time.monotonic() - start_time
+        if elapsed_time >= timeout_sec and timeout_sec != 0:
             raise RuntimeError(
                 f"Waiting for pod `{namespace}:{pod_name}` timed out after "
                 f"{timeout_sec} seconds."
             )
 
+        # Poll quickly while the pod is making progress and back off while
+        # nothing changes.
+        if (
+            resp.status.phase != phase
+            or last_log_timestamp != previous_log_timestamp
+        ):
+            phase = resp.status.phase
+            backoff_interval = minimum_backoff
+
         # Wait (using exponential backoff).
-        time.sleep(backoff_interval)
-        if exponential_backoff and backoff_interval < maximum_backoff:
-            backoff_interval *= 2
+        if stop_event is None:
+            time.sleep(backoff_interval)
+        elif stop_event.wait(backoff_interval):
+            raise RuntimeError(
+                f"Stopped waiting for pod `{namespace}:{pod_name}`."
+            )
+        if exponential_backoff:
+            backoff_interval = min(
+                backoff_interval * backoff_factor, maximum_backoff
+            )
 
 
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
@@ -31,6 +31,9 @@
 """Kubernetes-native orchestrator."""
 
 import os
+import signal
+import threading
+from types import FrameType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
 
 from kubernetes import client as k8s_client
@@ -72,6 +75,22 @@ class KubernetesOrchestrator(ContainerizedOrchestrator):
 
     _k8s_client: Optional[k8s_client.ApiClient] = None
 
+    def __init__(self, **values: Any):
+        """Initializes the orchestrator.
+
+        Args:
+            **values: Values to set in the orchestrator.
+        """
+        super().__init__(**values)
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """Stops waiting for the orchestrator pod of a synchronous run.
+
+        The pipeline run itself continues in the orchestrator pod.
+        """
+        self._stop_event.set()
+
     def get_kube_client(
         self, incluster: Optional[bool] = None
     ) -> k8s_client.ApiClient:
@@ -270,9 +289,9 @@ class KubernetesOrchestrator(ContainerizedOrchestrator):
                 # go through all stack components and identify those that
                 # advertise a local path where they persist information that
                 # they need to be available when running pipelines.
-                for stack_comp in stack.components.values():
-                    if stack_comp.local_path is None:
-                        continue
+                local_components = stack.local_components
+                if local_components:
+                    stack_comp, _ = local_components[0]
                     return False, (
                         f"{msg}the Kubernetes orchestrator is configured to "
                         f"run pipelines in a remote Kubernetes cluster but the "
@@ -442,22 +461,71 @@ class KubernetesOrchestrator(ContainerizedOrchestrator):
 
         # Wait for the orchestrator pod to finish and stream logs.
         if settings.synchronous:
-            logger.info("Waiting for Kubernetes orchestrator pod...")
+            self._wait_for_orchestrator_pod(pod_name, settings=settings)
+        else:
+            logger.info(
+                f"Orchestration started asynchronously in pod "
+                f"`{self.config.kubernetes_namespace}:{pod_name}`. "
+                f"Run the following command to inspect the logs: "
+                f"`kubectl logs {pod_name} -n {self.config.kubernetes_namespace}`."
+            )
+
+    def _wait_for_orchestrator_pod(
+        self, pod_name: str, settings: KubernetesOrchestratorSettings
+    ) -> None:
+        """Waits for the orchestrator pod to finish and streams its logs.
+
+        The wait stops early if `stop()` is called, e.g. by the `SIGTERM`
+        handler that is installed while waiting in the main thread.
+
+        Args:
+            pod_name: The name of the orchestrator pod.
+            settings: The orchestrator settings.
+
+        Raises:
+            RuntimeError: If the orchestrator pod timed out.
+        """
+
+        def _handle_sigterm(signum: int, frame: Optional[FrameType]) -> None:
+            """Stops waiting for the orchestrator pod.
+
+            Args:
+                signum: The signal number.
+                frame: The current stack frame.
+            """
+            self.stop()
+
+        self._stop_event.clear()
+        # Signal handlers can only be installed in the main thread
+        handle_sigterm = threading.current_thread() is threading.main_thread()
+        if handle_sigterm:
+            previous_handler = signal.signal(signal.SIGTERM, _handle_sigterm)
+
+        logger.info("Waiting for Kubernetes orchestrator pod...")
+        try:
             kube_utils.wait_pod(
                 core_api=self._k8s_core_api,
                 pod_name=pod_name,
                 namespace=self.config.kubernetes_namespace,
                 exit_condition_lambda=kube_utils.pod_is_done,
+                exponential_backoff=True,
                 timeout_sec=settings.timeout,
                 stream_logs=True,
+                stop_event=self._stop_event,
             )
-        else:
+        except RuntimeError:
+            if not self._stop_event.is_set():
+                raise
             logger.info(
-                f"Orchestration started asynchronously in pod "
+                f"Stopped waiting for the orchestrator pod, the pipeline "
+                f"continues to run in pod "
                 f"`{self.config.kubernetes_namespace}:{pod_name}`. "
                 f"Run the following command to inspect the logs: "
                 f"`kubectl logs {pod_name} -n {self.config.kubernetes_namespace}`."
             )
+        finally:
+            if handle_sigterm:
+                signal.signal(signal.SIGTERM, previous_handler)
 
     def _get_service_account_name(
         self, settings: KubernetesOrchestratorSettings
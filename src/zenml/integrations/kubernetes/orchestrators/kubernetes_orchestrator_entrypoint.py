@@ -134,6 +134,7 @@ def main() -> None:
             pod_name=pod_name,
             namespace=args.kubernetes_namespace,
             exit_condition_lambda=kube_utils.pod_is_done,
+            exponential_backoff=True,
             stream_logs=True,
         )
         logger.info(f"Pod of step `{step_name}` completed.")
@@ -13,9 +13,20 @@
 #  permissions and limitations under the License.
 """Class for lineage graph generation."""
 
-from typing import List, Optional, Tuple, Union
+import json
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+from pydantic.json import pydantic_encoder
 
 from zenml.enums import ExecutionStatus
 from zenml.lineage_graph.edge import Edge
@@ -25,11 +36,31 @@ from zenml.lineage_graph.node import (
     StepNode,
     StepNodeDetails,
 )
-from zenml.models import PipelineRunResponseModel, StepRunResponseModel
+from zenml.models import (
+    ArtifactResponseModel,
+    PipelineRunResponseModel,
+    StepRunResponseModel,
+)
 
 ARTIFACT_PREFIX = "artifact_"
 STEP_PREFIX = "step_"
 
+# Shared encoder so serializing a graph does not create a new encoder for
+# each of its nodes and edges.
+_JSON_ENCODER = json.JSONEncoder(default=pydantic_encoder)
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Encodes an object to JSON using the standard library JSON encoder.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        The UTF-8 encoded JSON representation of the object.
+    """
+    return _JSON_ENCODER.encode(obj).encode()
+
 
 class LineageGraph(BaseModel):
     """A lineage graph representation of a PipelineRunResponseModel."""
@@ -39,15 +70,60 @@ class LineageGraph(BaseModel):
     root_step_id: Optional[str] = None
     run_metadata: List[Tuple[str, str, str]] = []
 
+    _seen_node_ids: Set[str] = PrivateAttr(default_factory=set)
+
+    @staticmethod
+    def _create_artifact_node(
+        node_id: str,
+        name: str,
+        artifact: ArtifactResponseModel,
+        status: ExecutionStatus,
+        parent_step_id: str,
+    ) -> ArtifactNode:
+        """Creates an artifact node.
+
+        Args:
+            node_id: The ID of the node.
+            name: The name of the artifact in the step it is connected to.
+            artifact: The artifact to create the node for.
+            status: The execution status of the node.
+            parent_step_id: The ID of the step the node belongs to.
+
+        Returns:
+            The artifact node.
+        """
+        return ArtifactNode.construct(
+            id=node_id,
+            data=ArtifactNodeDetails.construct(
+                execution_id=str(artifact.id),
+                name=name,
+                status=status,
+                is_cached=status == ExecutionStatus.CACHED,
+                artifact_type=str(artifact.type),
+                artifact_data_type=artifact.data_type.import_path,
+                parent_step_id=parent_step_id,
+                producer_step_id=str(artifact.producer_step_run_id),
+                uri=artifact.uri,
+                metadata=[
+                    (m.key, str(m.value), str(m.type))
+                    for m in artifact.metadata.values()
+                ],
+            ),
+        )
+
     def generate_step_nodes_and_edges(
         self, step: StepRunResponseModel
     ) -> None:
         """Generates the step nodes and the edges between them.
 
+        The nodes and edges are built from already validated response
+        models, so they are created without running pydantic validation.
+
         Args:
             step: The step to generate the nodes and edges for.
         """
-        step_id = STEP_PREFIX + str(step.id)
+        step_id = f"{STEP_PREFIX}{step.id}"
+        self._seen_node_ids.add(step_id)
         if self.root_step_id is None:
             self.root_step_id = step_id
         step_config = step.config.dict()
@@ -57,10 +133,11 @@ class LineageGraph(BaseModel):
                 for key, value in step_config.items()
                 if key not in ["inputs", "outputs", "parameters"] and value
             }
-        self.nodes.append(
-            StepNode(
+
+        nodes: List[Union[StepNode, ArtifactNode]] = [
+            StepNode.construct(
                 id=step_id,
-                data=StepNodeDetails(
+                data=StepNodeDetails.construct(
                     execution_id=str(step.id),
                     name=step.name,  # redundant for consistency
                     status=step.status,
@@ -75,48 +152,72 @@ class LineageGraph(BaseModel):
                     ],
                 ),
             )
-        )
+        ]
+        edges: List[Edge] = []
 
         for artifact_name, artifact in step.outputs.items():
-            artifact_id = ARTIFACT_PREFIX + str(artifact.id)
-            self.nodes.append(
-                ArtifactNode(
-                    id=artifact_id,
-                    data=ArtifactNodeDetails(
-                        execution_id=str(artifact.id),
+            artifact_id = f"{ARTIFACT_PREFIX}{artifact.id}"
+            if artifact_id not in self._seen_node_ids:
+                self._seen_node_ids.add(artifact_id)
+                nodes.append(
+                    self._create_artifact_node(
+                        node_id=artifact_id,
                         name=artifact_name,
+                        artifact=artifact,
                         status=step.status,
-                        is_cached=step.status == ExecutionStatus.CACHED,
-                        artifact_type=artifact.type,
-                        artifact_data_type=artifact.data_type.import_path,
                         parent_step_id=str(step.id),
-                        producer_step_id=str(artifact.producer_step_run_id),
-                        uri=artifact.uri,
-                        metadata=[
-                            (m.key, str(m.value), str(m.type))
-                            for m in artifact.metadata.values()
-                        ],
-                    ),
+                    )
                 )
-            )
-            self.edges.append(
-                Edge(
-                    id=step_id + "_" + artifact_id,
+            edges.append(
+                Edge.construct(
+                    id=f"{step_id}_to_{artifact_id}",
                     source=step_id,
                     target=artifact_id,
                 )
             )
 
-        for artifact_name, artifact in step.inputs.items():
-            artifact_id = ARTIFACT_PREFIX + str(artifact.id)
-            self.edges.append(
-                Edge(
-                    id=step_id + "_" + artifact_id,
+        for artifact in step.inputs.values():
+            artifact_id = f"{ARTIFACT_PREFIX}{artifact.id}"
+            edges.append(
+                Edge.construct(
+                    id=f"{artifact_id}_to_{step_id}",
                     source=artifact_id,
                     target=step_id,
                 )
             )
 
+        self.nodes.extend(nodes)
+        self.edges.extend(edges)
+
+    def generate_input_artifact_nodes(
+        self, step: StepRunResponseModel
+    ) -> None:
+        """Generates nodes for input artifacts that are not in the graph yet.
+
+        This needs to be called after the nodes of all steps were generated,
+        so that only artifacts which were not produced by any step of the
+        graph (e.g. artifacts loaded from a previous run) get a standalone
+        node.
+
+        Args:
+            step: The step to generate the input artifact nodes for.
+        """
+        for artifact_name, artifact in step.inputs.items():
+            artifact_id = f"{ARTIFACT_PREFIX}{artifact.id}"
+            if artifact_id in self._seen_node_ids:
+                continue
+
+            self._seen_node_ids.add(artifact_id)
+            self.nodes.append(
+                self._create_artifact_node(
+                    node_id=artifact_id,
+                    name=artifact_name,
+                    artifact=artifact,
+                    status=ExecutionStatus.COMPLETED,
+                    parent_step_id=str(artifact.producer_step_run_id),
+                )
+            )
+
     def generate_run_nodes_and_edges(
         self, run: PipelineRunResponseModel
     ) -> None:
@@ -130,3 +231,41 @@ class LineageGraph(BaseModel):
         ]
         for step in run.steps.values():
             self.generate_step_nodes_and_edges(step)
+        # The steps of a run are not ordered, so we only know which input
+        # artifacts are missing once the outputs of all steps were added.
+        for step in run.steps.values():
+            self.generate_input_artifact_nodes(step)
+
+    def iter_json(
+        self, encode: Optional[Callable[[Any], bytes]] = None
+    ) -> Iterator[bytes]:
+        """Serializes the graph to JSON one node and edge at a time.
+
+        In contrast to `.json()`, this never holds the dictionary
+        representation of the entire graph in memory.
+
+        Args:
+            encode: Optional function to encode the dictionary representation
+                of a single node or edge to UTF-8 encoded JSON. Defaults to
+                the standard library JSON encoder.
+
+        Yields:
+            Consecutive UTF-8 encoded chunks of the JSON representation of
+            the graph.
+        """
+        encode = encode or _encode_json
+        yield b'{"nodes": ['
+        for index, node in enumerate(self.nodes):
+            chunk = encode(node.dict())
+            yield b"," + chunk if index else chunk
+        yield b'], "edges": ['
+        for index, edge in enumerate(self.edges):
+            chunk = encode(edge.dict())
+            yield b"," + chunk if index else chunk
+        yield (
+            b'], "root_step_id": '
+            + encode(self.root_step_id)
+            + b', "run_metadata": '
+            + encode(self.run_metadata)
+            + b"}"
+        )
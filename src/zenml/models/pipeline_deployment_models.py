@@ -58,18 +58,6 @@ class PipelineDeploymentBaseModel(BaseModel):
         default={}, title="The client environment for this deployment."
     )
 
-    @property
-    def requires_included_files(self) -> bool:
-        """Whether the deployment requires included files.
-
-        Returns:
-            Whether the deployment requires included files.
-        """
-        return any(
-            step.config.docker_settings.source_files == SourceFileMode.INCLUDE
-            for step in self.step_configurations.values()
-        )
-
     @property
     def requires_code_download(self) -> bool:
         """Whether the deployment requires downloading some code files.
@@ -14,11 +14,13 @@
 """Pipeline build utilities."""
 import hashlib
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 from uuid import UUID
@@ -26,6 +28,7 @@ from uuid import UUID
 import zenml
 from zenml.client import Client
 from zenml.code_repositories import BaseCodeRepository
+from zenml.image_builders import BuildContext
 from zenml.logger import get_logger
 from zenml.models import (
     PipelineBuildRequestModel,
@@ -50,6 +53,8 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+MAX_CONCURRENT_IMAGE_BUILDS = 4
+
 
 def reuse_or_create_pipeline_build(
     deployment: "PipelineDeploymentBaseModel",
@@ -76,13 +81,15 @@ def reuse_or_create_pipeline_build(
         The build response.
     """
     if not build:
-        if (
-            allow_build_reuse
-            and code_repository
-            and not deployment.requires_included_files
-        ):
+        # Share the checksums of the build context files so they only get
+        # read once when looking for an existing build and creating one
+        source_checksums: Dict[Tuple[Optional[str], ...], str] = {}
+
+        if allow_build_reuse:
             existing_build = find_existing_build(
-                deployment=deployment, code_repository=code_repository
+                deployment=deployment,
+                code_repository=code_repository,
+                source_checksums=source_checksums,
             )
 
             if existing_build:
@@ -97,6 +104,7 @@ def reuse_or_create_pipeline_build(
             deployment=deployment,
             pipeline_id=pipeline_id,
             code_repository=code_repository,
+            source_checksums=source_checksums,
         )
 
     build_model = None
@@ -124,14 +132,20 @@ def reuse_or_create_pipeline_build(
 
 def find_existing_build(
     deployment: "PipelineDeploymentBaseModel",
-    code_repository: "BaseCodeRepository",
+    code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Tuple[Optional[str], ...], str]] = None,
 ) -> Optional["PipelineBuildResponseModel"]:
     """Find an existing build for a deployment.
 
+    Builds that include source files are only reused if none of these files
+    changed since the build, which is verified by the build checksum.
+
     Args:
         deployment: The deployment for which to find an existing build.
         code_repository: The code repository that will be used to download
             files in the images.
+        source_checksums: Optional cache of source file checksums, see
+            `compute_build_checksum(...)`.
 
     Returns:
         The existing build to reuse if found.
@@ -146,7 +160,14 @@ def find_existing_build(
         return None
 
     build_checksum = compute_build_checksum(
-        required_builds, stack=stack, code_repository=code_repository
+        required_builds,
+        stack=stack,
+        code_repository=code_repository,
+        source_checksums=source_checksums,
+    )
+    contains_code = any(
+        build_config.should_include_files(code_repository=code_repository)
+        for build_config in required_builds
     )
 
     matches = client.list_builds(
@@ -158,9 +179,9 @@ def find_existing_build(
         # TODO: Should we support this by storing the unique Docker ID for
         # the image and checking if an image with that ID exists locally?
         is_local=False,
-        # The build contains some code which might be different than the
-        # local code the user is expecting to run
-        contains_code=False,
+        # Builds that contain code have a checksum which includes the source
+        # files, so we only match those if we need to include code
+        contains_code=contains_code,
         zenml_version=zenml.__version__,
         # Match all patch versions of the same Python major + minor
         python_version=f"startswith:{python_version_prefix}",
@@ -177,6 +198,7 @@ def create_pipeline_build(
     deployment: "PipelineDeploymentBaseModel",
     pipeline_id: Optional[UUID] = None,
     code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Tuple[Optional[str], ...], str]] = None,
 ) -> Optional["PipelineBuildResponseModel"]:
     """Builds images and registers the output in the server.
 
@@ -185,6 +207,8 @@ def create_pipeline_build(
         pipeline_id: The ID of the pipeline.
         code_repository: If provided, this code repository will be used to
             download inside the build images.
+        source_checksums: Optional cache of source file checksums, see
+            `compute_build_checksum(...)`.
 
     Returns:
         The build output.
@@ -207,8 +231,8 @@ def create_pipeline_build(
     )
 
     docker_image_builder = PipelineDockerImageBuilder()
-    images: Dict[str, BuildItem] = {}
     checksums: Dict[str, str] = {}
+    unique_builds: Dict[str, "BuildConfiguration"] = {}
 
     for build_config in required_builds:
         combined_key = PipelineBuildBaseModel.get_image_key(
@@ -218,8 +242,8 @@ def create_pipeline_build(
             stack=stack, code_repository=code_repository
         )
 
-        if combined_key in images:
-            previous_checksum = images[combined_key].settings_checksum
+        if combined_key in checksums:
+            previous_checksum = checksums[combined_key]
 
             if previous_checksum != checksum:
                 raise RuntimeError(
@@ -235,57 +259,84 @@ def create_pipeline_build(
             else:
                 continue
 
-        if checksum in checksums:
-            item_key = checksums[checksum]
-            image_name_or_digest = images[item_key].image
-            contains_code = images[item_key].contains_code
-            dockerfile = images[item_key].dockerfile
-            requirements = images[item_key].requirements
-        else:
-            tag = deployment.pipeline_configuration.name
-            if build_config.step_name:
-                tag += f"-{build_config.step_name}"
-            tag += f"-{build_config.key}"
-
-            include_files = build_config.should_include_files(
-                code_repository=code_repository,
-            )
-            download_files = build_config.should_download_files(
-                code_repository=code_repository,
-            )
+        checksums[combined_key] = checksum
+        # Build configurations with identical settings share a single image
+        unique_builds.setdefault(checksum, build_config)
 
-            (
-                image_name_or_digest,
-                dockerfile,
-                requirements,
-            ) = docker_image_builder.build_docker_image(
-                docker_settings=build_config.settings,
-                tag=tag,
-                stack=stack,
-                include_files=include_files,
-                download_files=download_files,
-                entrypoint=build_config.entrypoint,
-                extra_files=build_config.extra_files,
-                code_repository=code_repository,
-            )
-            contains_code = include_files
+    def _build_image(checksum: str) -> BuildItem:
+        """Builds the image for a build configuration.
+
+        Args:
+            checksum: The settings checksum of the build configuration.
+
+        Returns:
+            The build item for the image.
+        """
+        build_config = unique_builds[checksum]
+
+        tag = deployment.pipeline_configuration.name
+        if build_config.step_name:
+            tag += f"-{build_config.step_name}"
+        tag += f"-{build_config.key}"
+
+        include_files = build_config.should_include_files(
+            code_repository=code_repository,
+        )
+        download_files = build_config.should_download_files(
+            code_repository=code_repository,
+        )
+
+        (
+            image_name_or_digest,
+            dockerfile,
+            requirements,
+        ) = docker_image_builder.build_docker_image(
+            docker_settings=build_config.settings,
+            tag=tag,
+            stack=stack,
+            include_files=include_files,
+            download_files=download_files,
+            entrypoint=build_config.entrypoint,
+            extra_files=build_config.extra_files,
+            code_repository=code_repository,
+        )
 
-        images[combined_key] = BuildItem(
+        return BuildItem(
             image=image_name_or_digest,
             dockerfile=dockerfile,
             requirements=requirements,
             settings_checksum=checksum,
-            contains_code=contains_code,
+            contains_code=include_files,
             requires_code_download=download_files,
         )
-        checksums[checksum] = combined_key
+
+    # Make sure a default image builder gets assigned to the stack if
+    # required before building images concurrently
+    stack.validate_image_builder()
+
+    # Building and pushing images is mostly IO-bound, so we build images with
+    # different settings concurrently
+    with ThreadPoolExecutor(
+        max_workers=min(len(unique_builds), MAX_CONCURRENT_IMAGE_BUILDS)
+    ) as executor:
+        build_items = dict(
+            zip(unique_builds, executor.map(_build_image, unique_builds))
+        )
+
+    images = {
+        combined_key: build_items[checksum]
+        for combined_key, checksum in checksums.items()
+    }
 
     logger.info("Finished building Docker image(s).")
 
     is_local = stack.container_registry is None
     contains_code = any(item.contains_code for item in images.values())
     build_checksum = compute_build_checksum(
-        required_builds, stack=stack, code_repository=code_repository
+        required_builds,
+        stack=stack,
+        code_repository=code_repository,
+        source_checksums=source_checksums,
     )
 
     build_request = PipelineBuildRequestModel(
@@ -307,9 +358,13 @@ def compute_build_checksum(
     items: List["BuildConfiguration"],
     stack: "Stack",
     code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Tuple[Optional[str], ...], str]] = None,
 ) -> str:
     """Compute an overall checksum for a pipeline build.
 
+    For items that include source files in their image or that get built from
+    a custom Dockerfile, the checksum also covers the content of these files.
+
     Args:
         items: Items of the build.
         stack: The stack associated with the build. Will be used to gather
@@ -317,11 +372,16 @@ def compute_build_checksum(
         code_repository: The code repository that will be used to download
             files inside the build. Will be used for its dependency
             specification.
+        source_checksums: Optional cache of build context checksums. Missing
+            checksums will be computed and added to it, which allows reusing
+            them for multiple build checksums.
 
     Returns:
         The build checksum.
     """
     hash_ = hashlib.md5()
+    if source_checksums is None:
+        source_checksums = {}
 
     for item in items:
         key = PipelineBuildBaseModel.get_image_key(
@@ -336,9 +396,56 @@ def compute_build_checksum(
         hash_.update(key.encode())
         hash_.update(settings_checksum.encode())
 
+        if item.settings.dockerfile:
+            hash_.update(
+                _compute_build_context_checksum(
+                    root=item.settings.build_context_root,
+                    dockerfile=item.settings.dockerfile,
+                    cache=source_checksums,
+                ).encode()
+            )
+
+        if item.should_include_files(code_repository=code_repository):
+            hash_.update(
+                _compute_build_context_checksum(
+                    root=source_utils.get_source_root(),
+                    dockerignore_file=item.settings.dockerignore,
+                    cache=source_checksums,
+                ).encode()
+            )
+
     return hash_.hexdigest()
 
 
+def _compute_build_context_checksum(
+    root: Optional[str],
+    cache: Dict[Tuple[Optional[str], ...], str],
+    dockerignore_file: Optional[str] = None,
+    dockerfile: Optional[str] = None,
+) -> str:
+    """Compute the checksum of the files of a build context.
+
+    Args:
+        root: The root directory of the build context.
+        cache: Cache of previously computed build context checksums.
+        dockerignore_file: Optional dockerignore file of the build context.
+        dockerfile: Optional path to a Dockerfile to add to the build context.
+
+    Returns:
+        The build context checksum.
+    """
+    key = (root, dockerignore_file, dockerfile)
+    if key not in cache:
+        build_context = BuildContext(
+            root=root, dockerignore_file=dockerignore_file
+        )
+        if dockerfile:
+            build_context.add_file(source=dockerfile, destination="Dockerfile")
+        cache[key] = build_context.compute_checksum()
+
+    return cache[key]
+
+
 def verify_local_repository_context(
     deployment: "PipelineDeploymentBaseModel",
     local_repo_context: Optional["LocalRepositoryContext"],
@@ -447,7 +554,18 @@ def verify_custom_build(
         build_checksum = compute_build_checksum(
             required_builds, stack=stack, code_repository=code_repository
         )
-        if build_checksum != build.checksum:
+        if build_checksum != build.checksum and build.contains_code:
+            # The checksum of builds that contain code also covers the
+            # included source files, so we can't tell which one changed
+            logger.warning(
+                "The Docker settings or the source files used for the build "
+                "`%s` are not the same as currently specified for your "
+                "pipeline. This means that the build you specified to run "
+                "this pipeline might be outdated and contain outdated "
+                "requirements or code.",
+                build.id,
+            )
+        elif build_checksum != build.checksum:
             logger.warning(
                 "The Docker settings used for the build `%s` are "
                 "not the same as currently specified for your pipeline. "
@@ -106,6 +106,26 @@ class ThreadedDagRunner:
 
         return True
 
+    def _prepare_node_run(self, node: str) -> bool:
+        """Updates the node status to running if the node is ready to be run.
+
+        The check and the status update happen while holding the lock, so a
+        node whose upstream nodes finish concurrently in separate threads is
+        only started once.
+
+        Args:
+            node: The node.
+
+        Returns:
+            True if the node is now running and needs to be started, else
+            False.
+        """
+        with self._lock:
+            if not self._can_run(node):
+                return False
+            self.node_states[node] = NodeStatus.RUNNING
+            return True
+
     def _run_node(self, node: str) -> None:
         """Run a single node.
 
@@ -120,8 +140,9 @@ class ThreadedDagRunner:
     def _run_node_in_thread(self, node: str) -> threading.Thread:
         """Run a single node in a separate thread.
 
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+        Calls self._run_node() in a new thread and returns the thread. The
+        node status needs to be updated to running beforehand using
+        `self._prepare_node_run()`.
 
         Args:
             node: The node.
@@ -129,10 +150,7 @@ class ThreadedDagRunner:
         Returns:
             The thread in which the node was run.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
+        assert self.node_states[node] == NodeStatus.RUNNING
 
         # Run node in new thread.
         thread = threading.Thread(target=self._run_node, args=(node,))
@@ -155,9 +173,9 @@ class ThreadedDagRunner:
 
         # Run downstream nodes.
         threads = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                thread = self._run_node_in_thread(downstram_node)
+        for downstream_node in self.reversed_dag[node]:
+            if self._prepare_node_run(downstream_node):
+                thread = self._run_node_in_thread(downstream_node)
                 threads.append(thread)
 
         # Wait for all downstream nodes to complete.
@@ -175,7 +193,7 @@ class ThreadedDagRunner:
         # upstream nodes have completed.
         threads = []
         for node in self.nodes:
-            if self._can_run(node):
+            if self._prepare_node_run(node):
                 thread = self._run_node_in_thread(node)
                 threads.append(thread)
 
@@ -24,6 +24,7 @@ from typing import (
     NoReturn,
     Optional,
     Set,
+    Tuple,
     Type,
 )
 from uuid import UUID
@@ -332,6 +333,22 @@ class Stack:
             if component is not None
         }
 
+    @property
+    def local_components(self) -> List[Tuple["StackComponent", str]]:
+        """Components of the stack that persist information locally.
+
+        Returns:
+            Tuples (component, local_path) for all components of the stack
+            that advertise a local path where they persist information that
+            needs to be available when running pipelines.
+        """
+        local_components = []
+        for component in self.components.values():
+            local_path = component.local_path
+            if local_path:
+                local_components.append((component, local_path))
+        return local_components
+
     @property
     def id(self) -> UUID:
         """The ID of the stack.
@@ -533,14 +550,8 @@ class Stack:
 
         local_stores_path = GlobalConfiguration().local_stores_path
 
-        # go through all stack components and identify those that advertise
-        # a local path where they persist information that they need to be
-        # available when running pipelines.
-        has_local_paths = False
-        for stack_comp in self.components.values():
-            local_path = stack_comp.local_path
-            if not local_path:
-                continue
+        local_components = self.local_components
+        for stack_comp, local_path in local_components:
             # double-check this convention, just in case it wasn't respected
             # as documented in `StackComponent.local_path`
             if not local_path.startswith(local_stores_path):
@@ -549,9 +560,8 @@ class Stack:
                     f"{stack_comp.name} is not in the local stores "
                     f"directory ({local_stores_path})."
                 )
-            has_local_paths = True
 
-        return has_local_paths
+        return bool(local_components)
 
     @property
     def required_secrets(self) -> Set["secret_utils.SecretReference"]:
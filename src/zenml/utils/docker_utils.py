@@ -15,7 +15,9 @@
 
 import json
 import os
+import random
 import re
+import time
 from typing import (
     Any,
     Dict,
@@ -29,6 +31,7 @@ from typing import (
 )
 
 from docker.client import DockerClient
+from docker.errors import APIError
 from docker.utils import build as docker_build_utils
 
 from zenml.io import fileio
@@ -37,6 +40,18 @@ from zenml.utils import io_utils, string_utils
 
 logger = get_logger(__name__)
 
+PUSH_MAX_ATTEMPTS = 6
+PUSH_INITIAL_BACKOFF_SECONDS = 2
+PUSH_MAXIMUM_BACKOFF_SECONDS = 60
+RETRYABLE_PUSH_STATUS_CODES = (429, 500, 502, 503, 504)
+# Matches HTTP status codes reported in push error messages, e.g.
+# `received unexpected HTTP status: 503 Service Unavailable`.
+RETRYABLE_PUSH_ERROR_REGEX = re.compile(
+    r"\b(?:status|code)\b\W*(?:"
+    + "|".join(str(code) for code in RETRYABLE_PUSH_STATUS_CODES)
+    + r")\b"
+)
+
 
 def check_docker() -> bool:
     """Checks if Docker is installed and running.
@@ -245,6 +260,9 @@ def push_image(
 ) -> str:
     """Pushes an image to a container registry.
 
+    Pushes that fail because of rate limiting or server errors of the
+    registry are retried with exponential backoff.
+
     Args:
         image_name: The full name (including a tag) of the image to push.
         docker_client: Optional Docker client to use for pushing the image. If
@@ -259,8 +277,34 @@ def push_image(
     """
     logger.info("Pushing Docker image `%s`.", image_name)
     docker_client = docker_client or DockerClient.from_env()
-    output_stream = docker_client.images.push(image_name, stream=True)
-    aux_info = _process_stream(output_stream)
+
+    for attempt in range(1, PUSH_MAX_ATTEMPTS + 1):
+        try:
+            output_stream = docker_client.images.push(image_name, stream=True)
+            aux_info = _process_stream(output_stream)
+            break
+        except (APIError, RuntimeError) as e:
+            if attempt == PUSH_MAX_ATTEMPTS or not _is_retryable_push_error(e):
+                raise
+
+            backoff = min(
+                PUSH_INITIAL_BACKOFF_SECONDS * 2 ** (attempt - 1),
+                PUSH_MAXIMUM_BACKOFF_SECONDS,
+            )
+            retry_after = _get_retry_after(e)
+            # Add jitter so that concurrent pushes don't retry in lockstep
+            wait = retry_after or backoff / 2 + random.uniform(0, backoff / 2)
+            logger.warning(
+                "Pushing Docker image `%s` failed with a transient registry "
+                "error (%s). Retrying in %.1f seconds (attempt %d/%d).",
+                image_name,
+                e,
+                wait,
+                attempt + 1,
+                PUSH_MAX_ATTEMPTS,
+            )
+            time.sleep(wait)
+
     logger.info("Finished pushing Docker image.")
 
     image_name_without_tag, _ = image_name.rsplit(":", maxsplit=1)
@@ -276,6 +320,48 @@ def push_image(
         )
 
 
+def _is_retryable_push_error(error: Exception) -> bool:
+    """Checks whether an error that occurred while pushing is transient.
+
+    Args:
+        error: The error raised while pushing an image.
+
+    Returns:
+        Whether the push should be retried.
+    """
+    if isinstance(error, APIError):
+        return error.status_code in RETRYABLE_PUSH_STATUS_CODES
+
+    # Registry errors that happen during the push are reported as part of
+    # the output stream, which only contains the error message.
+    message = str(error).lower()
+    return "toomanyrequests" in message or bool(
+        RETRYABLE_PUSH_ERROR_REGEX.search(message)
+    )
+
+
+def _get_retry_after(error: Exception) -> Optional[float]:
+    """Gets the `Retry-After` header value of a failed push request.
+
+    Args:
+        error: The error raised while pushing an image.
+
+    Returns:
+        The number of seconds to wait before retrying, if the registry
+        specified it. The value is capped at `PUSH_MAXIMUM_BACKOFF_SECONDS`.
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+
+    try:
+        retry_after = float(response.headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    return min(max(retry_after, 0.0), PUSH_MAXIMUM_BACKOFF_SECONDS)
+
+
 def tag_image(image_name: str, target: str) -> None:
     """Tags an image.
 
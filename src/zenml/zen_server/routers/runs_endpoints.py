@@ -15,7 +15,10 @@
 from typing import Any, Dict
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, Security
+from fastapi.responses import StreamingResponse
+from pydantic.json import pydantic_encoder
 
 from zenml.constants import (
     API,
@@ -51,6 +54,20 @@ router = APIRouter(
 )
 
 
+def _orjson_encode(obj: Any) -> bytes:
+    """Encodes an object to JSON using orjson.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        The UTF-8 encoded JSON representation of the object.
+    """
+    return orjson.dumps(
+        obj, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS
+    )
+
+
 @router.get(
     "",
     response_model=Page[PipelineRunResponseModel],
@@ -144,9 +161,13 @@ def delete_run(
 def get_run_dag(
     run_id: UUID,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> LineageGraph:
+) -> StreamingResponse:
     """Get the DAG for a given pipeline run.
 
+    The graph is streamed to the client instead of being converted to a
+    dictionary and revalidated as a whole, which keeps the memory usage low
+    for large pipelines.
+
     Args:
         run_id: ID of the pipeline run to use to get the DAG.
 
@@ -156,7 +177,9 @@ def get_run_dag(
     run = zen_store().get_run(run_name_or_id=run_id)
     graph = LineageGraph()
     graph.generate_run_nodes_and_edges(run)
-    return graph
+    return StreamingResponse(
+        graph.iter_json(encode=_orjson_encode), media_type="application/json"
+    )
 
 
 @router.get(
@@ -0,0 +1,127 @@
+"""Compress step configurations [98cf8f95f02f].
+
+Revision ID: 98cf8f95f02f
+Revises: 0.42.1
+Create Date: 2026-10-15 09:12:41.318507
+
+"""
+import zlib
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import MEDIUMBLOB, MEDIUMTEXT
+
+# revision identifiers, used by Alembic.
+revision = "98cf8f95f02f"
+down_revision = "0.42.1"
+branch_labels = None
+depends_on = None
+
+MEDIUM_LENGTH = 16777215
+COMPRESSION_LEVEL = 6
+MIN_COMPRESSED_SIZE = 1024
+# Step configurations can be up to 16MiB each, so we only load a limited
+# number of deployments into memory at once.
+BATCH_SIZE = 100
+
+
+def _convert_step_configurations(compress: bool) -> None:
+    """Converts the step configurations of all pipeline deployments.
+
+    The converted value is stored in the temporary
+    `step_configurations_converted` column.
+
+    Args:
+        compress: If `True`, the JSON step configurations get compressed if
+            they are large enough, otherwise they get decompressed.
+    """
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=op.get_bind())
+    meta.reflect(only=("pipeline_deployment",))
+    deployments = sa.Table("pipeline_deployment", meta)
+
+    last_id = None
+    while True:
+        query = (
+            select([deployments.c.id, deployments.c.step_configurations])
+            .order_by(deployments.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(deployments.c.id > last_id)
+
+        rows = conn.execute(query).all()
+        if not rows:
+            break
+
+        for deployment_id, step_configurations in rows:
+            if compress:
+                converted = step_configurations.encode()
+                if len(converted) >= MIN_COMPRESSED_SIZE:
+                    converted = zlib.compress(converted, COMPRESSION_LEVEL)
+            elif step_configurations.startswith(b"{"):
+                # Small step configurations are stored uncompressed.
+                converted = step_configurations.decode()
+            else:
+                converted = zlib.decompress(step_configurations).decode()
+
+            conn.execute(
+                deployments.update()
+                .where(deployments.c.id == deployment_id)
+                .values(step_configurations_converted=converted)
+            )
+
+        last_id = rows[-1][0]
+
+
+def _add_converted_column(column_type: sa.types.TypeEngine) -> None:
+    """Adds the temporary column for the converted step configurations.
+
+    Args:
+        column_type: The type of the column.
+    """
+    with op.batch_alter_table("pipeline_deployment", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "step_configurations_converted", column_type, nullable=True
+            )
+        )
+
+
+def _replace_column_with_converted_column(
+    column_type: sa.types.TypeEngine,
+) -> None:
+    """Replaces the step configurations with the converted column.
+
+    Args:
+        column_type: The type of the converted column.
+    """
+    with op.batch_alter_table("pipeline_deployment", schema=None) as batch_op:
+        batch_op.drop_column("step_configurations")
+        batch_op.alter_column(
+            "step_configurations_converted",
+            new_column_name="step_configurations",
+            existing_type=column_type,
+            nullable=False,
+        )
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    column_type = sa.LargeBinary(length=MEDIUM_LENGTH).with_variant(
+        MEDIUMBLOB, "mysql"
+    )
+    _add_converted_column(column_type)
+    _convert_step_configurations(compress=True)
+    _replace_column_with_converted_column(column_type)
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    column_type = sa.String(length=MEDIUM_LENGTH).with_variant(
+        MEDIUMTEXT, "mysql"
+    )
+    _add_converted_column(column_type)
+    _convert_step_configurations(compress=False)
+    _replace_column_with_converted_column(column_type)
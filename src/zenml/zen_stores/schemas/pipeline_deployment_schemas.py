@@ -14,12 +14,13 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
+import zlib
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
-from sqlalchemy import TEXT, Column, String
-from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy import TEXT, Column, LargeBinary
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
 from sqlmodel import Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -43,6 +44,42 @@ from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 if TYPE_CHECKING:
     from zenml.zen_stores.schemas import PipelineRunSchema
 
+STEP_CONFIGURATIONS_COMPRESSION_LEVEL = 6
+# Step configurations smaller than this (in bytes) are stored uncompressed as
+# compressing them saves little space but costs CPU time on every read.
+STEP_CONFIGURATIONS_MIN_COMPRESSED_SIZE = 1024
+
+
+def _encode_step_configurations(step_configurations: str) -> bytes:
+    """Encodes JSON step configurations for storage in the database.
+
+    Args:
+        step_configurations: The JSON step configurations.
+
+    Returns:
+        The step configurations, zlib compressed if they are large enough.
+    """
+    encoded = step_configurations.encode()
+    if len(encoded) < STEP_CONFIGURATIONS_MIN_COMPRESSED_SIZE:
+        return encoded
+    return zlib.compress(encoded, STEP_CONFIGURATIONS_COMPRESSION_LEVEL)
+
+
+def _decode_step_configurations(step_configurations: bytes) -> str:
+    """Decodes step configurations stored in the database.
+
+    Args:
+        step_configurations: The stored step configurations.
+
+    Returns:
+        The JSON step configurations.
+    """
+    # Uncompressed configurations are a JSON object, while zlib compressed
+    # data never starts with a curly brace.
+    if step_configurations.startswith(b"{"):
+        return step_configurations.decode()
+    return zlib.decompress(step_configurations).decode()
+
 
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
@@ -127,10 +164,13 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
 
     run_name_template: str
     pipeline_configuration: str = Field(sa_column=Column(TEXT, nullable=False))
-    step_configurations: str = Field(
+    # JSON which is zlib compressed if it is larger than
+    # `STEP_CONFIGURATIONS_MIN_COMPRESSED_SIZE`. Step configurations consist
+    # mostly of repeated keys and compress very well.
+    step_configurations: bytes = Field(
         sa_column=Column(
-            String(length=MEDIUMTEXT_MAX_LENGTH).with_variant(
-                MEDIUMTEXT, "mysql"
+            LargeBinary(length=MEDIUMTEXT_MAX_LENGTH).with_variant(
+                MEDIUMBLOB, "mysql"
             ),
             nullable=False,
         )
@@ -163,10 +203,12 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             code_reference_id=code_reference_id,
             run_name_template=request.run_name_template,
             pipeline_configuration=request.pipeline_configuration.json(),
-            step_configurations=json.dumps(
-                request.step_configurations,
-                sort_keys=False,
-                default=pydantic_encoder,
+            step_configurations=_encode_step_configurations(
+                json.dumps(
+                    request.step_configurations,
+                    sort_keys=False,
+                    default=pydantic_encoder,
+                )
             ),
             client_environment=json.dumps(request.client_environment),
         )
@@ -196,6 +238,8 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             pipeline_configuration=PipelineConfiguration.parse_raw(
                 self.pipeline_configuration
             ),
-            step_configurations=json.loads(self.step_configurations),
+            step_configurations=json.loads(
+                _decode_step_configurations(self.step_configurations)
+            ),
             client_environment=json.loads(self.client_environment),
         )
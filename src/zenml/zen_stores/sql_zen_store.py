@@ -19,6 +19,7 @@ import logging
 import math
 import os
 import re
+from collections import defaultdict
 from contextvars import ContextVar
 from pathlib import Path, PurePath
 from typing import (
@@ -47,7 +48,7 @@ from sqlalchemy.exc import (
     OperationalError,
 )
 from sqlalchemy.orm import noload
-from sqlmodel import Session, create_engine, or_, select
+from sqlmodel import Session, col, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
 from zenml.config.global_config import GlobalConfiguration
@@ -3348,9 +3349,12 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The converted pipeline run model with steps hydrated into it.
         """
+        step_runs = list(run.step_runs)
         steps = {
-            step.name: self._run_step_schema_to_model(step)
-            for step in run.step_runs
+            step_run.name: step
+            for step_run, step in zip(
+                step_runs, self._run_step_schemas_to_models(step_runs)
+            )
         }
         return run.to_model(steps=steps)
 
@@ -3768,54 +3772,101 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The run step model.
         """
+        return self._run_step_schemas_to_models([step_run])[0]
+
+    def _run_step_schemas_to_models(
+        self, step_runs: List[StepRunSchema]
+    ) -> List[StepRunResponseModel]:
+        """Converts multiple run step schemas to step models.
+
+        The parent steps and artifacts of all step runs are fetched at once,
+        so the number of queries does not grow with the number of steps.
+
+        Args:
+            step_runs: The run step schemas to convert.
+
+        Returns:
+            The run step models in the same order as the schemas.
+        """
+        if not step_runs:
+            return []
+
+        step_run_ids = [step_run.id for step_run in step_runs]
         with Session(self.engine) as session:
             # Get parent steps.
-            parent_steps = session.exec(
-                select(StepRunSchema)
-                .where(StepRunParentsSchema.child_id == step_run.id)
-                .where(StepRunParentsSchema.parent_id == StepRunSchema.id)
-            ).all()
-            parent_step_ids = [parent_step.id for parent_step in parent_steps]
+            parent_step_ids: Dict[UUID, List[UUID]] = defaultdict(list)
+            for child_id, parent_id in session.exec(
+                select(
+                    StepRunParentsSchema.child_id,
+                    StepRunParentsSchema.parent_id,
+                ).where(col(StepRunParentsSchema.child_id).in_(step_run_ids))
+            ).all():
+                parent_step_ids[child_id].append(parent_id)
 
             # Get input artifacts.
             input_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
+                    StepRunInputArtifactSchema.step_id,
                     StepRunInputArtifactSchema.name,
                 )
                 .where(
                     ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id
                 )
-                .where(StepRunInputArtifactSchema.step_id == step_run.id)
+                .where(
+                    col(StepRunInputArtifactSchema.step_id).in_(step_run_ids)
+                )
             ).all()
-            input_artifacts = {
-                input_name: self._artifact_schema_to_model(artifact)
-                for (artifact, input_name) in input_artifact_list
-            }
 
             # Get output artifacts.
             output_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
+                    StepRunOutputArtifactSchema.step_id,
                     StepRunOutputArtifactSchema.name,
                 )
                 .where(
                     ArtifactSchema.id
                     == StepRunOutputArtifactSchema.artifact_id
                 )
-                .where(StepRunOutputArtifactSchema.step_id == step_run.id)
+                .where(
+                    col(StepRunOutputArtifactSchema.step_id).in_(step_run_ids)
+                )
             ).all()
-            output_artifacts = {
-                output_name: self._artifact_schema_to_model(artifact)
-                for (artifact, output_name) in output_artifact_list
-            }
 
-            # Convert to model.
-            return step_run.to_model(
-                parent_step_ids=parent_step_ids,
-                input_artifacts=input_artifacts,
-                output_artifacts=output_artifacts,
+            # Find the producer step run IDs of all artifacts at once.
+            producer_step_run_ids = self._get_producer_step_run_ids(
+                session=session,
+                artifact_ids=[
+                    artifact.id
+                    for artifact, _, _ in input_artifact_list
+                    + output_artifact_list
+                ],
             )
+            input_artifacts: Dict[
+                UUID, Dict[str, ArtifactResponseModel]
+            ] = defaultdict(dict)
+            for artifact, step_run_id, input_name in input_artifact_list:
+                input_artifacts[step_run_id][input_name] = artifact.to_model(
+                    producer_step_run_id=producer_step_run_ids.get(artifact.id)
+                )
+            output_artifacts: Dict[
+                UUID, Dict[str, ArtifactResponseModel]
+            ] = defaultdict(dict)
+            for artifact, step_run_id, output_name in output_artifact_list:
+                output_artifacts[step_run_id][output_name] = artifact.to_model(
+                    producer_step_run_id=producer_step_run_ids.get(artifact.id)
+                )
+
+            # Convert to models.
+            return [
+                step_run.to_model(
+                    parent_step_ids=parent_step_ids[step_run.id],
+                    input_artifacts=input_artifacts[step_run.id],
+                    output_artifacts=output_artifacts[step_run.id],
+                )
+                for step_run in step_runs
+            ]
 
     def list_run_steps(
         self, step_run_filter_model: StepRunFilterModel
@@ -3932,20 +3983,51 @@ class SqlZenStore(BaseZenStore):
         """
         # Find the producer step run ID.
         with Session(self.engine) as session:
-            producer_step_run_id = session.exec(
-                select(StepRunOutputArtifactSchema.step_id)
-                .where(
-                    StepRunOutputArtifactSchema.artifact_id
-                    == artifact_schema.id
-                )
-                .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
-                .where(StepRunSchema.status != ExecutionStatus.CACHED)
-            ).first()
+            producer_step_run_ids = self._get_producer_step_run_ids(
+                session=session, artifact_ids=[artifact_schema.id]
+            )
 
             # Convert the artifact schema to a model.
             return artifact_schema.to_model(
-                producer_step_run_id=producer_step_run_id
+                producer_step_run_id=producer_step_run_ids.get(
+                    artifact_schema.id
+                )
+            )
+
+    @staticmethod
+    def _get_producer_step_run_ids(
+        session: Session, artifact_ids: List[UUID]
+    ) -> Dict[UUID, UUID]:
+        """Gets the IDs of the step runs that produced the given artifacts.
+
+        Args:
+            session: The session to use for the query.
+            artifact_ids: The IDs of the artifacts.
+
+        Returns:
+            A mapping from artifact ID to the ID of the (non-cached) step run
+            that produced the artifact. Artifacts without a producer step run
+            are not included.
+        """
+        if not artifact_ids:
+            return {}
+
+        results = session.exec(
+            select(
+                StepRunOutputArtifactSchema.artifact_id,
+                StepRunOutputArtifactSchema.step_id,
+            )
+            .where(
+                col(StepRunOutputArtifactSchema.artifact_id).in_(artifact_ids)
             )
+            .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
+            .where(StepRunSchema.status != ExecutionStatus.CACHED)
+        ).all()
+
+        producer_step_run_ids: Dict[UUID, UUID] = {}
+        for artifact_id, step_run_id in results:
+            producer_step_run_ids.setdefault(artifact_id, step_run_id)
+        return producer_step_run_ids
 
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 """Tests for the lineage graph."""
 
+import json
+
 from tests.integration.functional.zen_stores.utils import (
     constant_int_output_test_step,
     int_plus_one_test_step,
@@ -102,7 +104,7 @@ def test_generate_run_nodes_and_edges(
         for output_artifact in step_.outputs.values():
             artifact_id = ARTIFACT_PREFIX + str(output_artifact.id)
             assert artifact_id in node_id_to_model_mapping
-            edge_id = step_id + "_" + artifact_id
+            edge_id = step_id + "_to_" + artifact_id
             assert edge_id in edge_id_to_model_mapping
             edge = edge_id_to_model_mapping[edge_id]
             assert edge.source == step_id
@@ -112,7 +114,7 @@ def test_generate_run_nodes_and_edges(
         for input_artifact in step_.inputs.values():
             artifact_id = ARTIFACT_PREFIX + str(input_artifact.id)
             assert artifact_id in node_id_to_model_mapping
-            edge_id = step_id + "_" + artifact_id
+            edge_id = artifact_id + "_to_" + step_id
             assert edge_id in edge_id_to_model_mapping
             edge = edge_id_to_model_mapping[edge_id]
             assert edge.source == artifact_id
@@ -142,3 +144,58 @@ def test_generate_run_nodes_and_edges(
                 "True",
                 MetadataTypeEnum.BOOL,
             )
+
+
+def test_lineage_graph_json_streaming(
+    clean_client, connected_two_step_pipeline
+):
+    """Tests that the streamed JSON of a lineage graph is complete."""
+    connected_two_step_pipeline(
+        step_1=constant_int_output_test_step(),
+        step_2=int_plus_one_test_step(),
+    ).run()
+    pipeline_run = clean_client.get_pipeline(
+        "connected_two_step_pipeline"
+    ).runs[0]
+
+    graph = LineageGraph()
+    graph.generate_run_nodes_and_edges(pipeline_run)
+
+    assert json.loads(b"".join(graph.iter_json())) == json.loads(graph.json())
+
+
+def test_lineage_graph_does_not_depend_on_step_order(
+    clean_client, connected_two_step_pipeline
+):
+    """Tests that artifact nodes are the same for any order of the steps."""
+    connected_two_step_pipeline(
+        step_1=constant_int_output_test_step(),
+        step_2=int_plus_one_test_step(),
+    ).run()
+    pipeline_run = clean_client.get_pipeline(
+        "connected_two_step_pipeline"
+    ).runs[0]
+    reversed_run = pipeline_run.copy(
+        update={"steps": dict(reversed(list(pipeline_run.steps.items())))}
+    )
+
+    graph = LineageGraph()
+    graph.generate_run_nodes_and_edges(pipeline_run)
+    reversed_graph = LineageGraph()
+    reversed_graph.generate_run_nodes_and_edges(reversed_run)
+
+    assert len(reversed_graph.nodes) == 4
+    assert {node.id: node for node in reversed_graph.nodes} == {
+        node.id: node for node in graph.nodes
+    }
+
+    step_1 = pipeline_run.steps["step_1"]
+    output_name, output_artifact = next(iter(step_1.outputs.items()))
+    artifact_node = next(
+        node
+        for node in reversed_graph.nodes
+        if node.id == ARTIFACT_PREFIX + str(output_artifact.id)
+    )
+    assert artifact_node.data.name == output_name
+    assert artifact_node.data.status == step_1.status
+    assert artifact_node.data.parent_step_id == str(step_1.id)
@@ -96,3 +96,26 @@ def test_stack_validation(
             image_builder=image_builder,
             container_registry=remote_container_registry,
         ).validate()
+
+
+def test_cloud_build_uses_previous_image_as_cache() -> None:
+    """Tests that the Cloud Build pulls the previous image and uses it as
+    build cache."""
+    image_builder = _get_gcp_image_builder()
+    image_name = "gcr.io/project/zenml:pipeline-orchestrator"
+
+    build = image_builder._configure_cloud_build(
+        image_name=image_name,
+        cloud_build_context="gs://bucket/context.tar.gz",
+    )
+
+    pull_step, build_step, push_step = build.steps
+    assert f"docker pull {image_name} || exit 0" in pull_step.args
+    assert build_step.args[:5] == [
+        "build",
+        "--network=cloudbuild",
+        "--cache-from",
+        image_name,
+        "-t",
+    ]
+    assert push_step.args == ["push", image_name]
@@ -0,0 +1,235 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Unit tests for kube_utils.py."""
+
+import threading
+
+import pytest
+from kubernetes.client import V1Pod, V1PodStatus
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+
+
+def _pod(phase: str) -> V1Pod:
+    """Creates a pod in the given phase.
+
+    Args:
+        phase: The pod phase.
+
+    Returns:
+        The pod.
+    """
+    return V1Pod(status=V1PodStatus(phase=phase))
+
+
+def test_stream_pod_logs_skips_already_logged_lines(mocker):
+    """Tests that lines logged by a previous stream are not logged again."""
+    mock_stream = mocker.patch.object(
+        kube_utils.k8s_watch.Watch,
+        "stream",
+        return_value=iter(
+            [
+                "2023-07-21T16:01:02.1Z line 1",
+                "2023-07-21T16:01:02.123456789Z line 2",
+                "2023-07-21T16:01:03Z line 3",
+            ]
+        ),
+    )
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+    since_timestamp = kube_utils._parse_log_timestamp(
+        "2023-07-21T16:01:02.123456789Z"
+    )
+
+    last_timestamp = kube_utils.stream_pod_logs(
+        core_api=mocker.Mock(),
+        pod_name="pod",
+        namespace="namespace",
+        since_timestamp=since_timestamp,
+    )
+
+    assert last_timestamp == kube_utils._parse_log_timestamp(
+        "2023-07-21T16:01:03Z"
+    )
+    assert "since_seconds" in mock_stream.call_args.kwargs
+    mock_logger.info.assert_called_once_with("line 3")
+
+
+def test_stream_pod_logs_logs_lines_with_the_same_timestamp(mocker):
+    """Tests that lines of a stream with the same timestamp are all logged."""
+    mocker.patch.object(
+        kube_utils.k8s_watch.Watch,
+        "stream",
+        return_value=iter(
+            [
+                "2023-07-21T16:01:02Z line 1",
+                "2023-07-21T16:01:03Z line 2",
+                "2023-07-21T16:01:03Z line 3",
+            ]
+        ),
+    )
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+
+    last_timestamp = kube_utils.stream_pod_logs(
+        core_api=mocker.Mock(), pod_name="pod", namespace="namespace"
+    )
+
+    assert last_timestamp == kube_utils._parse_log_timestamp(
+        "2023-07-21T16:01:03Z"
+    )
+    assert [call.args for call in mock_logger.info.call_args_list] == [
+        ("line 1",),
+        ("line 2",),
+        ("line 3",),
+    ]
+
+
+def test_parse_log_timestamp():
+    """Tests parsing the timestamps of pod log lines."""
+    assert kube_utils._parse_log_timestamp("1970-01-01T00:00:01Z") == 10**9
+    assert (
+        kube_utils._parse_log_timestamp("1970-01-01T02:00:01.5+02:00")
+        == 15 * 10**8
+    )
+    assert kube_utils._parse_log_timestamp("not a timestamp") is None
+
+
+def test_wait_pod_streams_logs_until_pod_is_done(mocker):
+    """Tests that the pod status is refreshed right after the log stream."""
+    mocker.patch.object(
+        kube_utils,
+        "get_pod",
+        side_effect=[_pod("Running"), _pod("Succeeded")],
+    )
+    mock_stream = mocker.patch.object(
+        kube_utils, "stream_pod_logs", return_value=10**9
+    )
+    mock_sleep = mocker.patch.object(kube_utils.time, "sleep")
+
+    pod = kube_utils.wait_pod(
+        core_api=mocker.Mock(),
+        pod_name="pod",
+        namespace="namespace",
+        exit_condition_lambda=kube_utils.pod_is_done,
+        stream_logs=True,
+    )
+
+    assert kube_utils.pod_is_done(pod)
+    mock_stream.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_wait_pod_times_out_while_streaming_logs(mocker):
+    """Tests that the timeout is enforced while the logs are streamed."""
+    now = [0.0]
+
+    def _stream(*args, **kwargs):
+        while True:
+            now[0] += 10
+            yield "2023-07-21T16:01:02Z line"
+
+    mocker.patch.object(
+        kube_utils.time, "monotonic", side_effect=lambda: now[0]
+    )
+    mock_stream = mocker.patch.object(
+        kube_utils.k8s_watch.Watch, "stream", side_effect=_stream
+    )
+    mocker.patch.object(kube_utils, "get_pod", return_value=_pod("Running"))
+    mocker.patch.object(kube_utils, "logger")
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        kube_utils.wait_pod(
+            core_api=mocker.Mock(),
+            pod_name="pod",
+            namespace="namespace",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            timeout_sec=25,
+            stream_logs=True,
+        )
+
+    mock_stream.assert_called_once()
+    assert mock_stream.call_args.kwargs["_request_timeout"] == 25
+    assert now[0] == 30
+
+
+def test_wait_pod_backoff_resets_on_phase_change(mocker):
+    """Tests that the polling interval grows and resets on phase changes."""
+    mocker.patch.object(
+        kube_utils,
+        "get_pod",
+        side_effect=[
+            _pod("Pending"),
+            _pod("Pending"),
+            _pod("Running"),
+            _pod("Running"),
+            _pod("Succeeded"),
+        ],
+    )
+    mock_sleep = mocker.patch.object(kube_utils.time, "sleep")
+
+    kube_utils.wait_pod(
+        core_api=mocker.Mock(),
+        pod_name="pod",
+        namespace="namespace",
+        exit_condition_lambda=kube_utils.pod_is_done,
+        exponential_backoff=True,
+    )
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [
+        1.0,
+        1.5,
+        1.0,
+        1.5,
+    ]
+
+
+def test_wait_pod_stops_when_stop_event_is_set(mocker):
+    """Tests that setting the stop event cancels the wait."""
+    mocker.patch.object(kube_utils, "get_pod", return_value=_pod("Running"))
+    stop_event = threading.Event()
+    stop_event.set()
+
+    with pytest.raises(RuntimeError):
+        kube_utils.wait_pod(
+            core_api=mocker.Mock(),
+            pod_name="pod",
+            namespace="namespace",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            stop_event=stop_event,
+        )
+
+
+def test_wait_pod_limits_log_streams_with_stop_event(mocker):
+    """Tests that log streams end in time to notice the stop event."""
+    mocker.patch.object(kube_utils, "get_pod", return_value=_pod("Running"))
+    mocker.patch.object(kube_utils.time, "monotonic", return_value=100.0)
+    stop_event = threading.Event()
+
+    def _stream_pod_logs(deadline, **kwargs):
+        assert deadline == 100.0 + kube_utils.STOP_EVENT_LOG_STREAM_SECS
+        stop_event.set()
+
+    mock_stream_pod_logs = mocker.patch.object(
+        kube_utils, "stream_pod_logs", side_effect=_stream_pod_logs
+    )
+
+    with pytest.raises(RuntimeError, match="Stopped waiting"):
+        kube_utils.wait_pod(
+            core_api=mocker.Mock(),
+            pod_name="pod",
+            namespace="namespace",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            stream_logs=True,
+            stop_event=stop_event,
+        )
+    mock_stream_pod_logs.assert_called_once()
@@ -186,3 +186,32 @@ def test_kubernetes_orchestrator_uses_service_account_from_settings(mocker):
         orchestrator._get_service_account_name(settings)
         == service_account_name
     )
+
+
+def test_kubernetes_orchestrator_stops_waiting_for_orchestrator_pod(mocker):
+    """Tests that stopping the orchestrator stops waiting for its pod."""
+    _patch_k8s_clients(mocker)
+    orchestrator = _get_kubernetes_orchestrator()
+
+    def _wait_pod(stop_event, **kwargs):
+        assert stop_event is orchestrator._stop_event
+        orchestrator.stop()
+        raise RuntimeError("Stopped waiting for pod.")
+
+    mock_wait_pod = mocker.patch(
+        "zenml.integrations.kubernetes.orchestrators.kube_utils.wait_pod",
+        side_effect=_wait_pod,
+    )
+
+    with does_not_raise():
+        orchestrator._wait_for_orchestrator_pod(
+            "pod", settings=KubernetesOrchestratorSettings()
+        )
+    mock_wait_pod.assert_called_once()
+
+    # Other errors, like timeouts, are still raised
+    mock_wait_pod.side_effect = RuntimeError("Timed out.")
+    with pytest.raises(RuntimeError):
+        orchestrator._wait_for_orchestrator_pod(
+            "pod", settings=KubernetesOrchestratorSettings()
+        )
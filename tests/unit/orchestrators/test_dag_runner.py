@@ -12,6 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+from collections import defaultdict
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
@@ -68,3 +70,21 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_dag_runner_runs_node_with_concurrent_upstream_nodes_once():
+    """Test that a node with concurrently finishing upstreams runs once."""
+    barrier = threading.Barrier(2)
+    run_counts: Dict[str, int] = defaultdict(int)
+    lock = threading.Lock()
+
+    def run_fn(node: str) -> None:
+        if node in ("1", "2"):
+            barrier.wait(timeout=5)
+        with lock:
+            run_counts[node] += 1
+
+    for _ in range(20):
+        run_counts.clear()
+        ThreadedDagRunner({"1": [], "2": [], "3": ["1", "2"]}, run_fn).run()
+        assert run_counts == {"1": 1, "2": 1, "3": 1}
@@ -287,6 +287,41 @@ def test_building_with_different_keys_and_identical_settings(
     mock_build_docker_image.assert_called_once()
 
 
+def test_building_with_different_keys_and_different_settings(
+    clean_client, mocker
+):
+    """Tests that two build configurations with different keys and different
+    settings lead to two builds with the correct images assigned."""
+    build_config_1 = BuildConfiguration(key="key1", settings=DockerSettings())
+    build_config_2 = BuildConfiguration(
+        key="key2", settings=DockerSettings(requirements=["requirement"])
+    )
+
+    mocker.patch.object(
+        Stack,
+        "get_docker_builds",
+        return_value=[build_config_1, build_config_2],
+    )
+    mock_build_docker_image = mocker.patch.object(
+        PipelineDockerImageBuilder,
+        "build_docker_image",
+        side_effect=lambda tag, **kwargs: (f"image_{tag}", "", ""),
+    )
+
+    deployment = PipelineDeploymentBaseModel(
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline"},
+        step_configurations={},
+    )
+
+    build = build_utils.create_pipeline_build(deployment=deployment)
+    assert len(build.images) == 2
+    assert build.images["key1"].image == "image_pipeline-key1"
+    assert build.images["key2"].image == "image_pipeline-key2"
+
+    assert mock_build_docker_image.call_count == 2
+
+
 def test_custom_build_verification(
     mocker,
     sample_deployment_response_model,
@@ -400,6 +435,96 @@ def test_build_checksum_computation(clean_client, mocker):
     assert checksum != new_checksum
 
 
+def test_build_checksum_includes_source_files(clean_client, mocker, tmp_path):
+    """Tests that the build checksum changes if included source files
+    change."""
+    mocker.patch(
+        "zenml.utils.source_utils.get_source_root",
+        return_value=str(tmp_path),
+    )
+    source_file = tmp_path / "run.py"
+    source_file.write_text("print('Aria')")
+
+    build_config = BuildConfiguration(key="key", settings=DockerSettings())
+    assert build_config.should_include_files(code_repository=None)
+
+    checksum = build_utils.compute_build_checksum(
+        items=[build_config], stack=clean_client.active_stack
+    )
+    assert checksum == build_utils.compute_build_checksum(
+        items=[build_config], stack=clean_client.active_stack
+    )
+
+    source_file.write_text("print('Blupus')")
+    new_checksum = build_utils.compute_build_checksum(
+        items=[build_config], stack=clean_client.active_stack
+    )
+    assert checksum != new_checksum
+
+    # Files are not included if they can be downloaded from a code repository
+    code_repository_checksum = build_utils.compute_build_checksum(
+        items=[build_config],
+        stack=clean_client.active_stack,
+        code_repository=StubCodeRepository(),
+    )
+    source_file.write_text("print('Axl')")
+    assert code_repository_checksum == build_utils.compute_build_checksum(
+        items=[build_config],
+        stack=clean_client.active_stack,
+        code_repository=StubCodeRepository(),
+    )
+
+    # Source checksums are reused if a cache is passed
+    source_checksums = {}
+    checksum = build_utils.compute_build_checksum(
+        items=[build_config],
+        stack=clean_client.active_stack,
+        source_checksums=source_checksums,
+    )
+    assert len(source_checksums) == 1
+    source_file.write_text("print('Rick')")
+    assert checksum == build_utils.compute_build_checksum(
+        items=[build_config],
+        stack=clean_client.active_stack,
+        source_checksums=source_checksums,
+    )
+
+
+def test_build_checksum_includes_custom_dockerfile(clean_client, tmp_path):
+    """Tests that the build checksum changes if the custom Dockerfile or its
+    build context change."""
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM zenmldocker/zenml")
+    build_context_root = tmp_path / "context"
+    build_context_root.mkdir()
+    context_file = build_context_root / "file.txt"
+    context_file.write_text("Aria")
+
+    build_config = BuildConfiguration(
+        key="key",
+        settings=DockerSettings(
+            dockerfile=str(dockerfile),
+            build_context_root=str(build_context_root),
+            source_files="ignore",
+        ),
+    )
+
+    checksum = build_utils.compute_build_checksum(
+        items=[build_config], stack=clean_client.active_stack
+    )
+
+    dockerfile.write_text("FROM zenmldocker/zenml:latest")
+    dockerfile_checksum = build_utils.compute_build_checksum(
+        items=[build_config], stack=clean_client.active_stack
+    )
+    assert dockerfile_checksum != checksum
+
+    context_file.write_text("Blupus")
+    assert dockerfile_checksum != build_utils.compute_build_checksum(
+        items=[build_config], stack=clean_client.active_stack
+    )
+
+
 def test_local_repo_verification(mocker, sample_deployment_response_model):
     """Test the local repo verification."""
     mocker.patch.object(
@@ -527,3 +652,19 @@ def test_finding_existing_build(
     )
 
     assert not build
+
+    # Without a code repository, files need to be included in the images
+    mock_list_builds.reset_mock()
+    build_utils.find_existing_build(
+        deployment=sample_deployment_response_model
+    )
+    mock_list_builds.assert_called_once_with(
+        sort_by="desc:created",
+        size=1,
+        stack_id=clean_client.active_stack.id,
+        is_local=False,
+        contains_code=True,
+        zenml_version=zenml.__version__,
+        python_version=f"startswith:{sys.version_info.major}.{sys.version_info.minor}",
+        checksum="checksum",
+    )
@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import os
 from contextlib import ExitStack as does_not_raise
 from uuid import uuid4
 
@@ -117,6 +118,36 @@ def test_stack_requirements(stack_with_mock_components):
     }
 
 
+def test_stack_local_components(stack_with_mock_components):
+    """Tests that the stack returns only the components with a local path."""
+    stack_with_mock_components.orchestrator.local_path = None
+    stack_with_mock_components.artifact_store.local_path = "/local/path"
+
+    assert stack_with_mock_components.local_components == [
+        (stack_with_mock_components.artifact_store, "/local/path")
+    ]
+
+
+def test_stack_check_local_paths(stack_with_mock_components):
+    """Tests that local paths outside the local stores directory fail."""
+    from zenml.config.global_config import GlobalConfiguration
+
+    local_stores_path = GlobalConfiguration().local_stores_path
+    stack_with_mock_components.orchestrator.local_path = None
+    stack_with_mock_components.artifact_store.local_path = None
+    assert not stack_with_mock_components.check_local_paths()
+
+    stack_with_mock_components.artifact_store.local_path = os.path.join(
+        local_stores_path, "artifacts"
+    )
+    assert stack_with_mock_components.check_local_paths()
+
+    stack_with_mock_components.artifact_store.name = "artifact_store"
+    stack_with_mock_components.artifact_store.local_path = "/local/path"
+    with pytest.raises(ValueError):
+        stack_with_mock_components.check_local_paths()
+
+
 def test_stack_validation_fails_if_a_components_validator_fails(
     stack_with_mock_components, failing_stack_validator
 ):
@@ -0,0 +1,99 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Unit tests for docker_utils.py."""
+
+import json
+
+import pytest
+from docker.errors import APIError
+
+from zenml.utils import docker_utils
+
+
+def _stream(*lines):
+    """Creates a Docker output stream from JSON lines."""
+    return iter([json.dumps(line).encode() for line in lines])
+
+
+def test_push_image_retries_transient_registry_errors(mocker):
+    """Tests that pushes failing with a rate limit error are retried."""
+    mock_sleep = mocker.patch.object(docker_utils.time, "sleep")
+    docker_client = mocker.Mock()
+    docker_client.images.push.side_effect = [
+        _stream({"error": "toomanyrequests: Rate exceeded"}),
+        _stream({"aux": {"Digest": "sha256:digest"}}),
+    ]
+
+    image = docker_utils.push_image(
+        "registry.com/image:tag", docker_client=docker_client
+    )
+
+    assert image == "registry.com/image@sha256:digest"
+    assert docker_client.images.push.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+def test_push_image_does_not_retry_other_errors(mocker):
+    """Tests that pushes failing with a non-transient error are not
+    retried."""
+    mock_sleep = mocker.patch.object(docker_utils.time, "sleep")
+    docker_client = mocker.Mock()
+    docker_client.images.push.return_value = _stream(
+        {"error": "denied: requested access to the resource is denied"}
+    )
+
+    with pytest.raises(RuntimeError):
+        docker_utils.push_image(
+            "registry.com/image:tag", docker_client=docker_client
+        )
+
+    docker_client.images.push.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_push_image_caps_retry_after(mocker):
+    """Tests that the `Retry-After` value of the registry is capped."""
+    mock_sleep = mocker.patch.object(docker_utils.time, "sleep")
+    response = mocker.Mock(status_code=429, headers={"Retry-After": "3600"})
+    docker_client = mocker.Mock()
+    docker_client.images.push.side_effect = [
+        APIError("Too many requests", response=response),
+        _stream({"aux": {"Digest": "sha256:digest"}}),
+    ]
+
+    docker_utils.push_image(
+        "registry.com/image:tag", docker_client=docker_client
+    )
+
+    mock_sleep.assert_called_once_with(
+        docker_utils.PUSH_MAXIMUM_BACKOFF_SECONDS
+    )
+
+
+@pytest.mark.parametrize(
+    "message, retryable",
+    [
+        ("received unexpected HTTP status: 503 Service Unavailable", True),
+        ("unknown: Status code 502", True),
+        ("toomanyrequests: Rate exceeded", True),
+        ("blob upload invalid: layer 500 of image", False),
+        ("denied: requested access to the resource is denied", False),
+    ],
+)
+def test_retryable_push_error_detection(message, retryable):
+    """Tests that only status codes in push errors are considered transient."""
+    assert (
+        docker_utils._is_retryable_push_error(RuntimeError(message))
+        is retryable
+    )
@@ -0,0 +1,47 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import json
+
+import pytest
+
+from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
+    STEP_CONFIGURATIONS_MIN_COMPRESSED_SIZE,
+    _decode_step_configurations,
+    _encode_step_configurations,
+)
+
+
+@pytest.mark.parametrize(
+    "size, compressed",
+    [
+        (STEP_CONFIGURATIONS_MIN_COMPRESSED_SIZE - 1, False),
+        (STEP_CONFIGURATIONS_MIN_COMPRESSED_SIZE, True),
+        (10 * STEP_CONFIGURATIONS_MIN_COMPRESSED_SIZE, True),
+    ],
+)
+def test_step_configurations_encoding_round_trip(size, compressed):
+    """Tests that encoded step configurations decode to the original JSON."""
+    step_configurations = json.dumps({"step": ""})
+    step_configurations = json.dumps(
+        {"step": "a" * (size - len(step_configurations))}
+    )
+    assert len(step_configurations) == size
+
+    encoded = _encode_step_configurations(step_configurations)
+
+    assert (encoded == step_configurations.encode()) is not compressed
+    if compressed:
+        assert len(encoded) < size
+    assert _decode_step_configurations(encoded) == step_configurations